@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,6 +11,10 @@ from api.routers.presentation.router import presentation_router
 from api.services.database import sql_engine
 from api.utils.utils import update_env_with_user_config
 from api.utils.model_utils import get_selected_llm_provider
+from image_processor.icons_vectorstore_utils import get_icons_vectorstore
+from image_processor.images_finder import close_http_session
+
+logger = logging.getLogger(__name__)
 
 can_change_keys = os.getenv("CAN_CHANGE_KEYS") != "false"
 
@@ -28,12 +33,24 @@ async def check_llm_model_availability():
 
 
 
+async def warm_up_icons_vectorstore():
+    # Loads the icons vector store in the background after startup, so the first
+    # request that needs icons doesn't wait for the embedding model to load
+    try:
+        await asyncio.to_thread(get_icons_vectorstore)
+    except Exception as e:
+        logger.warning("Error while loading icons vector store: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     os.makedirs(os.getenv("APP_DATA_DIRECTORY"), exist_ok=True)
     SQLModel.metadata.create_all(sql_engine)
     await check_llm_model_availability()
+    icons_vectorstore_warm_up = asyncio.create_task(warm_up_icons_vectorstore())
     yield
+    icons_vectorstore_warm_up.cancel()
+    await close_http_session()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -41,17 +58,19 @@ origins = ["*"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
-    allow_credentials=True,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
-@app.middleware("http")
 async def update_env_middleware(request: Request, call_next):
-    if can_change_keys:
-        update_env_with_user_config()
+    update_env_with_user_config()
     return await call_next(request)
 
 
+if can_change_keys:
+    app.middleware("http")(update_env_middleware)
+
+
 app.include_router(presentation_router)
@@ -1,5 +1,5 @@
 from enum import Enum
-import json
+import orjson
 from typing import Optional
 from pydantic import BaseModel
 
@@ -44,7 +44,8 @@ class SSEStatusResponse(BaseModel):
 
     def to_string(self):
         return SSEResponse(
-            event="response", data=json.dumps({"type": "status", "status": self.status})
+            event="response",
+            data=orjson.dumps({"type": "status", "status": self.status}).decode(),
         ).to_string()
 
 
@@ -55,7 +56,7 @@ class SSECompleteResponse(BaseModel):
     def to_string(self):
         return SSEResponse(
             event="response",
-            data=json.dumps({"type": "complete", self.key: self.value}),
+            data=orjson.dumps({"type": "complete", self.key: self.value}).decode(),
         ).to_string()
 
 
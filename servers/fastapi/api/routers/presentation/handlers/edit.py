@@ -1,6 +1,7 @@
 import asyncio
 import os
 import uuid
+from typing import Optional
 
 from sqlalchemy import update
 from sqlmodel import select
@@ -23,6 +24,7 @@ from ppt_generator.models.query_and_prompt_models import (
 )
 from ppt_generator.models.slide_model import SlideModel
 from ppt_generator.slide_generator import (
+    SELECTABLE_SLIDE_TYPES,
     get_edited_slide_content_model,
     get_slide_type_from_prompt,
 )
@@ -31,6 +33,15 @@ from api.sql_models import PresentationSqlModel, SlideSqlModel
 from api.services.database import get_sql_session
 
 
+def cancel_task(task: Optional[asyncio.Task]):
+    if task is None:
+        return
+    task.cancel()
+    # Retrieves the exception of a task that failed before it was cancelled,
+    # so asyncio doesn't log it as never retrieved
+    task.add_done_callback(lambda each: each.cancelled() or each.exception())
+
+
 class PresentationEditHandler:
     def __init__(self, data: EditPresentationSlideRequest):
         self.data = data
@@ -63,7 +74,28 @@ class PresentationEditHandler:
             ).first()
 
         slide_to_edit = SlideModel.from_dict(slide_to_edit_sql.model_dump(mode="json"))
-        new_slide_type = await get_slide_type_from_prompt(self.prompt, slide_to_edit)
+
+        # Slide type rarely changes, so content for the current type is edited
+        # while the new slide type is being selected. Types the selection
+        # prompt doesn't offer always change, so they aren't edited early.
+        current_type_edited_content = None
+        if slide_to_edit.type in SELECTABLE_SLIDE_TYPES:
+            current_type_edited_content = asyncio.create_task(
+                get_edited_slide_content_model(
+                    self.prompt,
+                    slide_to_edit.type,
+                    slide_to_edit,
+                    presentation.theme,
+                    presentation.language,
+                )
+            )
+        try:
+            new_slide_type = await get_slide_type_from_prompt(
+                self.prompt, slide_to_edit
+            )
+        except BaseException:
+            cancel_task(current_type_edited_content)
+            raise
         new_slide_type = new_slide_type.slide_type
 
         # Both OpenAI and Google support all graph types
@@ -75,13 +107,17 @@ class PresentationEditHandler:
             elif new_slide_type == 9:
                 new_slide_type = 6
 
-        edited_content = await get_edited_slide_content_model(
-            self.prompt,
-            new_slide_type,
-            slide_to_edit,
-            presentation.theme,
-            presentation.language,
-        )
+        if current_type_edited_content and new_slide_type == slide_to_edit.type:
+            edited_content = await current_type_edited_content
+        else:
+            cancel_task(current_type_edited_content)
+            edited_content = await get_edited_slide_content_model(
+                self.prompt,
+                new_slide_type,
+                slide_to_edit,
+                presentation.theme,
+                presentation.language,
+            )
 
         new_slide_model = SlideModel(
             id=slide_to_edit.id,
@@ -114,15 +150,13 @@ class PresentationEditHandler:
                 if slide_to_edit.images_count
                 else []
             )
+            old_images = slide_to_edit.images or []
             for index in range(new_slide_images_count):
                 new_prompt = new_slide_model.content.image_prompts[index]
-                for old_prompt in old_image_prompts:
-                    if old_prompt != new_prompt:
-                        continue
-                    if index < len(slide_to_edit.images or []):
-                        new_slide_images[index] = slide_to_edit.images[index]
-                        break
-                if not new_slide_images.get(index):
+                old_image = old_images[index] if index < len(old_images) else None
+                if old_image and new_prompt in old_image_prompts:
+                    new_slide_images[index] = old_image
+                else:
                     new_slide_images[index] = new_image_prompts[index]
 
         # ? Checks if icon queries have changed
@@ -134,15 +168,13 @@ class PresentationEditHandler:
             old_icon_queries = (
                 slide_to_edit.content.icon_queries if slide_to_edit.icons_count else []
             )
+            old_icons = slide_to_edit.icons or []
             for index in range(new_slide_icons_count):
                 new_query = new_slide_model.content.icon_queries[index]
-                for old_query in old_icon_queries:
-                    if old_query != new_query:
-                        continue
-                    if index < len(slide_to_edit.icons or []):
-                        new_slide_icons[index] = slide_to_edit.icons[index]
-                        break
-                if not new_slide_icons.get(index):
+                old_icon = old_icons[index] if index < len(old_icons) else None
+                if old_icon and new_query in old_icon_queries:
+                    new_slide_icons[index] = old_icon
+                else:
                     new_slide_icons[index] = new_icon_queries[index]
 
         images_to_generate = []
@@ -157,7 +189,7 @@ class PresentationEditHandler:
 
         images_directory = get_presentation_images_dir(self.presentation_id)
         if icons_to_generate:
-            icons_vectorstore = get_icons_vectorstore()
+            icons_vectorstore = await asyncio.to_thread(get_icons_vectorstore)
 
         coroutines = [
             generate_image(each_prompt, images_directory)
@@ -11,7 +11,7 @@ from api.services.database import get_sql_session
 from ppt_config_generator.models import PresentationMarkdownModel, SlideStructureModel
 from ppt_config_generator.structure_generator import generate_presentation_structure
 
-SLIDES_WITHOUT_GRAPH = [2, 4, 6, 7, 8]
+SLIDES_WITHOUT_GRAPH = (2, 4, 6, 7, 8)
 
 
 class PresentationGenerateDataHandler:
@@ -21,8 +21,9 @@ class PresentationGenerateDataHandler:
         self.session = str(uuid.uuid4())
 
     async def post(self, logging_service: LoggingService, log_metadata: LogMetadata):
+        data = self.data.model_dump(mode="json")
         logging_service.logger.info(
-            logging_service.message(self.data.model_dump()),
+            logging_service.message(data),
             extra=log_metadata.model_dump(),
         )
 
@@ -32,7 +33,7 @@ class PresentationGenerateDataHandler:
         key_value_model = KeyValueSqlModel(
             id=self.session,
             key=self.session,
-            value=self.data.model_dump(mode="json"),
+            value=data,
         )
 
         # Generate presentation structure for all providers
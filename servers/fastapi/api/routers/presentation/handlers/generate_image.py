@@ -29,7 +29,10 @@ class GenerateImageHandler:
         )
 
         images_directory = get_presentation_images_dir(self.data.presentation_id)
-        image_path = await generate_image(self.data.prompt, images_directory)
+        # The user asked for a new image, so previously generated ones aren't reused
+        image_path = await generate_image(
+            self.data.prompt, images_directory, use_cache=False
+        )
 
         response = PresentationAndPaths(
             presentation_id=self.data.presentation_id, paths=[image_path]
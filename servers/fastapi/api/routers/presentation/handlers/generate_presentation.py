@@ -1,6 +1,8 @@
-import json
-from typing import List
-import uuid, aiohttp
+import asyncio
+import logging
+from typing import Dict, List
+import aiohttp
+import orjson
 from fastapi import HTTPException
 from api.models import LogMetadata
 from api.routers.presentation.handlers.export_as_pptx import ExportAsPptxHandler
@@ -24,24 +26,73 @@ from ppt_config_generator.document_summary_generator import generate_document_su
 from ppt_config_generator.models import PresentationMarkdownModel
 from ppt_config_generator.ppt_outlines_generator import generate_ppt_content
 from ppt_generator.generator import generate_presentation
-from ppt_generator.models.llm_models import (
-    LLM_CONTENT_TYPE_MAPPING,
-)
 from ppt_generator.models.slide_model import SlideModel
+from ppt_generator.slide_model_utils import get_slide_models_from_presentation_json
+
+logger = logging.getLogger(__name__)
+
+# Theme colors are static, so each theme is fetched from Next.js only once
+THEMES_CACHE: Dict[str, dict] = {}
+# In progress theme fetches, so concurrent generations share a single request
+THEMES_PENDING: Dict[str, asyncio.Task] = {}
+
+
+async def fetch_theme_from_name(theme_name: str) -> dict:
+    logger.info("Fetching Theme Colors")
+    async with aiohttp.ClientSession() as session:
+        async with session.get(
+            "http://localhost/api/get-theme-from-name",
+            params={"theme": theme_name},
+        ) as response:
+            response.raise_for_status()
+            theme = await response.json(loads=orjson.loads)
+
+    THEMES_CACHE[theme_name] = theme
+    return theme
 
 
 class GeneratePresentationHandler(FetchAssetsOnPresentationGenerationMixin):
 
     def __init__(self, presentation_id: str, data: GeneratePresentationRequest):
-        self.session = str(uuid.uuid4())
         self.presentation_id = presentation_id
         self.data = data
 
-        self.temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
         self.presentation_dir = get_presentation_dir(self.presentation_id)
 
-    def __del__(self):
-        TEMP_FILE_SERVICE.cleanup_temp_dir(self.temp_dir)
+    async def __aenter__(self):
+        self.temp_dir = TEMP_FILE_SERVICE.create_temp_dir()
+        # One session for the export calls to the Next.js server
+        self.http_session = aiohttp.ClientSession()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.http_session.close()
+        await asyncio.to_thread(TEMP_FILE_SERVICE.cleanup_temp_dir, self.temp_dir)
+
+    def save_presentation(
+        self, presentation: PresentationSqlModel, slide_models: List[SlideModel]
+    ):
+        with get_sql_session() as sql_session:
+            sql_session.add(presentation)
+            sql_session.bulk_insert_mappings(
+                SlideSqlModel,
+                [each.to_create_dict(auto_id=True) for each in slide_models],
+            )
+            sql_session.commit()
+
+    async def fetch_theme(self) -> dict:
+        theme_name = self.data.theme.value
+        if theme_name in THEMES_CACHE:
+            return THEMES_CACHE[theme_name]
+
+        # The fetch uses its own session so it doesn't depend on the handler
+        # that started it staying open
+        task = THEMES_PENDING.get(theme_name)
+        if task is None:
+            task = asyncio.create_task(fetch_theme_from_name(theme_name))
+            THEMES_PENDING[theme_name] = task
+            task.add_done_callback(lambda _: THEMES_PENDING.pop(theme_name, None))
+        return await asyncio.shield(task)
 
     async def post(self, logging_service: LoggingService, log_metadata: LogMetadata):
 
@@ -55,12 +106,10 @@ class GeneratePresentationHandler(FetchAssetsOnPresentationGenerationMixin):
             documents_loader = DocumentsLoader(documents_and_images_path.documents)
             await documents_loader.load_documents(self.temp_dir)
 
-            print("-" * 40)
-            print("Generating Document Summary")
+            logger.info("Generating Document Summary")
             summary = await generate_document_summary(documents_loader.documents)
 
-        print("-" * 40)
-        print("Generating PPT Outline")
+        logger.info("Generating PPT Outline")
         presentation_content = await generate_ppt_content(
             self.data.prompt,
             self.data.n_slides,
@@ -68,48 +117,28 @@ class GeneratePresentationHandler(FetchAssetsOnPresentationGenerationMixin):
             summary,
         )
 
-        print("-" * 40)
-        print("Generating Presentation")
-        presentation_text = await generate_presentation(
-            PresentationMarkdownModel(
-                title=presentation_content.title,
-                slides=presentation_content.slides,
-                notes=presentation_content.notes,
-            )
+        logger.info("Generating Presentation")
+        presentation_text, self.theme = await asyncio.gather(
+            generate_presentation(
+                PresentationMarkdownModel(
+                    title=presentation_content.title,
+                    slides=presentation_content.slides,
+                    notes=presentation_content.notes,
+                )
+            ),
+            self.fetch_theme(),
         )
 
-        print("-" * 40)
-        print("Parsing Presentation")
-        presentation_json = json.loads(presentation_text)
-
-        slide_models: List[SlideModel] = []
-        for i, slide in enumerate(presentation_json["slides"]):
-            slide["index"] = i
-            slide["presentation"] = self.presentation_id
-            slide["content"] = (
-                LLM_CONTENT_TYPE_MAPPING[slide["type"]](**slide["content"])
-                .to_content()
-                .model_dump(mode="json")
-            )
-            slide_model = SlideModel(**slide)
-            slide_models.append(slide_model)
-
-        print("-" * 40)
-        print("Fetching Theme Colors")
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"http://localhost/api/get-theme-from-name?theme={self.data.theme.value}",
-            ) as response:
-                self.theme = await response.json()
+        logger.info("Parsing Presentation")
+        presentation_json = orjson.loads(presentation_text)
 
-        print("-" * 40)
-        print("Fetching Slide Assets")
-        async for result in self.fetch_slide_assets(slide_models):
-            print(result)
+        slide_models = get_slide_models_from_presentation_json(
+            presentation_json, self.presentation_id
+        )
 
-        slide_sql_models = [
-            SlideSqlModel(**each.model_dump(mode="json")) for each in slide_models
-        ]
+        logger.info("Fetching Slide Assets")
+        async for result in self.fetch_slide_assets(slide_models):
+            logger.debug(result)
 
         presentation = PresentationSqlModel(
             id=self.presentation_id,
@@ -123,29 +152,21 @@ class GeneratePresentationHandler(FetchAssetsOnPresentationGenerationMixin):
             notes=presentation_content.notes,
         )
 
-        with get_sql_session() as sql_session:
-            sql_session.add(presentation)
-            sql_session.add_all(slide_sql_models)
-            sql_session.commit()
-            for each in slide_sql_models:
-                sql_session.refresh(each)
+        await asyncio.to_thread(self.save_presentation, presentation, slide_models)
 
         if self.data.export_as == "pptx":
-            print("-" * 40)
-            print("Fetching Slide Metadata for Export")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"http://localhost/api/slide-metadata",
-                    json={
-                        "url": f"http://localhost/presentation?id={self.presentation_id}",
-                        "theme": self.theme["name"],
-                        "customColors": self.theme["colors"],
-                    },
-                ) as response:
-                    export_request_body = await response.json()
-
-            print("-" * 40)
-            print("Exporting Presentation")
+            logger.info("Fetching Slide Metadata for Export")
+            async with self.http_session.post(
+                f"http://localhost/api/slide-metadata",
+                json={
+                    "url": f"http://localhost/presentation?id={self.presentation_id}",
+                    "theme": self.theme["name"],
+                    "customColors": self.theme["colors"],
+                },
+            ) as response:
+                export_request_body = await response.json(loads=orjson.loads)
+
+            logger.info("Exporting Presentation")
             export_request_body["presentation_id"] = self.presentation_id
             export_request = ExportAsRequest(**export_request_body)
 
@@ -154,18 +175,16 @@ class GeneratePresentationHandler(FetchAssetsOnPresentationGenerationMixin):
             )
 
         else:
-            print("-" * 40)
-            print("Exporting Presentation as PDF")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"http://localhost/api/export-as-pdf",
-                    json={
-                        "url": f"http://localhost/pdf-maker?id={self.presentation_id}",
-                        "title": presentation_content.title,
-                    },
-                ) as response:
-                    response_json = await response.json()
+            logger.info("Exporting Presentation as PDF")
+
+            async with self.http_session.post(
+                f"http://localhost/api/export-as-pdf",
+                json={
+                    "url": f"http://localhost/pdf-maker?id={self.presentation_id}",
+                    "title": presentation_content.title,
+                },
+            ) as response:
+                response_json = await response.json(loads=orjson.loads)
 
             presentation_and_path = PresentationAndPath(
                 presentation_id=self.presentation_id,
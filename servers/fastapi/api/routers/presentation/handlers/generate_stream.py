@@ -1,6 +1,9 @@
+import asyncio
 import json
+import logging
 from typing import List
 
+import orjson
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 from sqlmodel import delete
@@ -24,14 +27,24 @@ from ppt_config_generator.models import (
 )
 from ppt_generator.generator import generate_presentation_stream
 from ppt_generator.models.llm_models import (
-    LLM_CONTENT_TYPE_MAPPING,
     LLMPresentationModel,
     LLMSlideModel,
 )
-from ppt_generator.models.slide_model import SlideModel
 from api.services.instances import TEMP_FILE_SERVICE
 
 from ppt_generator.slide_generator import get_slide_content_from_type_and_outline
+from ppt_generator.slide_model_utils import (
+    StreamedSlidesParser,
+    get_slide_model_from_llm_slide,
+    get_slide_models_from_presentation_json,
+)
+
+logger = logging.getLogger(__name__)
+
+# Chunk events are sent for every streamed token, so they are framed directly as
+# bytes instead of building an SSEResponse and serializing a dict for each one
+SSE_CHUNK_EVENT_PREFIX = b'event: response\ndata: {"type": "chunk", "chunk": '
+SSE_CHUNK_EVENT_SUFFIX = b"}\n\n"
 
 
 class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin):
@@ -39,6 +52,8 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
     def __init__(self, presentation_id: str, session: str):
         self.session = session
         self.presentation_id = presentation_id
+        # Image generations started while the presentation is still streaming
+        self.prefetched_images: List[asyncio.Task] = []
 
         self.temp_dir = TEMP_FILE_SERVICE.create_temp_dir(self.session)
         self.presentation_dir = get_presentation_dir(self.presentation_id)
@@ -62,14 +77,18 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
         self.outlines = self.data.outlines
 
         return StreamingResponse(
-            self.get_stream(*args, **kwargs), media_type="text/event-stream"
+            self.get_stream(*args, **kwargs),
+            media_type="text/event-stream",
+            # Prevent nginx from buffering events so chunks reach the client immediately
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
         )
 
     async def get_stream(
         self, logging_service: LoggingService, log_metadata: LogMetadata
     ):
+        data = self.data.model_dump(mode="json")
         logging_service.logger.info(
-            logging_service.message(self.data.model_dump(mode="json")),
+            logging_service.message(data),
             extra=log_metadata.model_dump(),
         )
 
@@ -78,7 +97,7 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
 
         with get_sql_session() as sql_session:
             presentation = sql_session.get(PresentationSqlModel, self.presentation_id)
-            presentation.outlines = [each.model_dump() for each in self.outlines]
+            presentation.outlines = data["outlines"]
             presentation.title = self.title or presentation.title
             presentation.theme = self.theme
             sql_session.exec(
@@ -87,7 +106,6 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
                 )
             )
             sql_session.commit()
-            sql_session.refresh(presentation)
 
         self.presentation = presentation
 
@@ -97,24 +115,22 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
 
         self.presentation_json = None
 
-        # self.presentation_json will be mutated by the generator
-        async for result in self.generate_presentation_openai_google():
-            yield result
-
-        slide_models: List[SlideModel] = []
-        for i, slide in enumerate(self.presentation_json["slides"]):
-            slide["index"] = i
-            slide["presentation"] = self.presentation.id
-            slide["content"] = (
-                LLM_CONTENT_TYPE_MAPPING[slide["type"]](**slide["content"])
-                .to_content()
-                .model_dump(mode="json")
+        try:
+            # self.presentation_json will be mutated by the generator
+            async for result in self.generate_presentation_openai_google():
+                yield result
+
+            slide_models = get_slide_models_from_presentation_json(
+                self.presentation_json, self.presentation.id
             )
-            slide_model = SlideModel(**slide)
-            slide_models.append(slide_model)
 
-        async for result in self.fetch_slide_assets(slide_models):
-            yield result
+            async for result in self.fetch_slide_assets(slide_models):
+                yield result
+        finally:
+            # Prefetched generations still running when the stream ends early,
+            # e.g. when the client disconnects, are not left running unattended
+            for each in self.prefetched_images:
+                each.cancel()
 
         slide_sql_models = [
             SlideSqlModel(**each.model_dump(mode="json")) for each in slide_models
@@ -123,8 +139,6 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
         with get_sql_session() as sql_session:
             sql_session.add_all(slide_sql_models)
             sql_session.commit()
-            for each in slide_sql_models:
-                sql_session.refresh(each)
 
         yield SSEStatusResponse(status="Packing slide data").to_string()
 
@@ -135,7 +149,8 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
         yield SSECompleteResponse(key="presentation", value=response).to_string()
 
     async def generate_presentation_openai_google(self):
-        presentation_text = ""
+        slides_parser = StreamedSlidesParser()
+        n_parsed_slides = 0
         async for event in await generate_presentation_stream(
             PresentationMarkdownModel(
                 title=self.title,
@@ -148,12 +163,20 @@ class PresentationGenerateStreamHandler(FetchAssetsOnPresentationGenerationMixin
             if chunk is None:
                 continue
 
-            presentation_text += chunk
-
-            yield SSEResponse(
-                event="response",
-                data=json.dumps({"type": "chunk", "chunk": chunk}),
-            ).to_string()
-
-        self.presentation_json = json.loads(presentation_text)
+            for slide in slides_parser.feed(chunk):
+                try:
+                    self.prefetch_slide_images(
+                        get_slide_model_from_llm_slide(
+                            slide, n_parsed_slides, self.presentation.id
+                        )
+                    )
+                except Exception as e:
+                    # Prefetching is best effort and must not end the stream.
+                    # Invalid slides are validated again with the full presentation.
+                    logger.debug("Skipping image prefetch for slide: %s", e)
+                n_parsed_slides += 1
+
+            yield SSE_CHUNK_EVENT_PREFIX + orjson.dumps(chunk) + SSE_CHUNK_EVENT_SUFFIX
+
+        self.presentation_json = json.loads(slides_parser.get_text())
 
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from api.models import LogMetadata
 from api.routers.presentation.models import (
@@ -25,7 +26,7 @@ class SearchIconHandler:
             extra=log_metadata.model_dump(),
         )
 
-        vector_store = get_icons_vectorstore()
+        vector_store = await asyncio.to_thread(get_icons_vectorstore)
 
         icon_paths = await get_icons(
             vector_store,
@@ -1,6 +1,8 @@
-from fastapi import UploadFile
+import os
+from fastapi import HTTPException, UploadFile
 
 from api.models import LogMetadata
+from api.services.instances import TEMP_FILE_SERVICE
 from api.services.logging import LoggingService
 
 
@@ -16,7 +18,12 @@ class UpdateParsedDocumentHandler:
             extra=log_metadata.model_dump(),
         )
 
-        with open(self.file_path, "wb") as f:
+        file_path = os.path.realpath(self.file_path)
+        temp_dir = os.path.realpath(TEMP_FILE_SERVICE.base_dir)
+        if os.path.commonpath([file_path, temp_dir]) != temp_dir:
+            raise HTTPException(400, "Invalid document path")
+
+        with open(file_path, "wb") as f:
             f.write(await self.file.read())
 
         return {"message": "File saved successfully"}
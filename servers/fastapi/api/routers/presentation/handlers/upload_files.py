@@ -1,3 +1,4 @@
+import logging
 from typing import List, Optional
 import uuid
 from fastapi import UploadFile
@@ -8,6 +9,10 @@ from api.validators import validate_files
 from document_processor.loader import UPLOAD_ACCEPTED_DOCUMENTS
 from api.services.instances import TEMP_FILE_SERVICE
 
+logger = logging.getLogger(__name__)
+
+UPLOAD_ACCEPTED_IMAGES = frozenset(["image/jpeg", "image/png", "image/webp"])
+
 
 class UploadFilesHandler:
 
@@ -21,7 +26,7 @@ class UploadFilesHandler:
 
         self.session = str(uuid.uuid4())
         self.temp_dir = TEMP_FILE_SERVICE.create_temp_dir(self.session)
-        print("Upload Temp Dir: " + self.temp_dir)
+        logger.debug("Upload Temp Dir: %s", self.temp_dir)
 
     async def post(self, logging_service: LoggingService, log_metadata: LogMetadata):
         logging_service.logger.info(
@@ -35,9 +40,7 @@ class UploadFilesHandler:
         )
 
         validate_files(self.documents, True, True, 50, UPLOAD_ACCEPTED_DOCUMENTS)
-        validate_files(
-            self.images, True, True, 10, ["image/jpeg", "image/png", "image/webp"]
-        )
+        validate_files(self.images, True, True, 10, UPLOAD_ACCEPTED_IMAGES)
 
         self.documents = self.documents or []
         self.images = self.images or []
@@ -12,6 +12,22 @@ from ppt_generator.slide_model_utils import SlideModelUtils
 
 class FetchAssetsOnPresentationGenerationMixin:
 
+    def prefetch_slide_images(self, slide_model: SlideModel):
+        # Starts generating a slide's images before the whole presentation is
+        # ready. fetch_slide_assets requests the same prompts later and reuses
+        # these generations through the prompt dedup in generate_image_once.
+        # Handlers using this must initialize self.prefetched_images and cancel
+        # the tasks when they finish
+        image_prompts = SlideModelUtils(self.theme, slide_model).get_image_prompts()
+        if not image_prompts:
+            return
+
+        images_directory = get_presentation_images_dir(self.presentation_id)
+        self.prefetched_images.extend(
+            asyncio.create_task(generate_image(each, images_directory))
+            for each in image_prompts
+        )
+
     async def fetch_slide_assets(self, slide_models: List[SlideModel]):
         image_prompts = []
         icon_queries = []
@@ -22,7 +38,7 @@ class FetchAssetsOnPresentationGenerationMixin:
             icon_queries.extend(slide_model_utils.get_icon_queries())
 
         if icon_queries:
-            icon_vector_store = get_icons_vectorstore()
+            icon_vector_store = await asyncio.to_thread(get_icons_vectorstore)
 
         images_directory = get_presentation_images_dir(self.presentation_id)
 
@@ -39,20 +55,20 @@ class FetchAssetsOnPresentationGenerationMixin:
         while not assets_future.done():
             status = SSEStatusResponse(status="Fetching slide assets").to_string()
             yield status
-            await asyncio.sleep(5)
+            await asyncio.wait([assets_future], timeout=5)
 
         assets = await assets_future
 
-        image_prompts_len = len(image_prompts)
-
-        images = assets[:image_prompts_len]
-        icons = assets[image_prompts_len:]
-
+        # Images are followed by icons in assets, both in slide order
+        images_start = 0
+        icons_start = images_count = len(image_prompts)
         for each_slide_model in slide_models:
-            each_slide_model.images = images[: each_slide_model.images_count]
-            images = images[each_slide_model.images_count :]
+            images_end = min(images_start + each_slide_model.images_count, images_count)
+            each_slide_model.images = assets[images_start:images_end]
+            images_start = images_end
 
-            each_slide_model.icons = icons[: each_slide_model.icons_count]
-            icons = icons[each_slide_model.icons_count :]
+            icons_end = icons_start + each_slide_model.icons_count
+            each_slide_model.icons = assets[icons_start:icons_end]
+            icons_start = icons_end
 
         yield SSEStatusResponse(status="Slide assets fetched").to_string()
@@ -1,6 +1,7 @@
 from typing import Annotated, List, Optional
 import uuid
 from fastapi import APIRouter, BackgroundTasks, Body, File, Form, UploadFile
+from fastapi.responses import ORJSONResponse
 import openai
 
 from api.models import SessionModel
@@ -78,7 +79,9 @@ from api.utils.utils import handle_errors
 from ppt_generator.models.slide_model import SlideModel
 
 route_prefix = "/api/v1/ppt"
-presentation_router = APIRouter(prefix=route_prefix)
+presentation_router = APIRouter(
+    prefix=route_prefix, default_response_class=ORJSONResponse
+)
 
 
 @presentation_router.get(
@@ -207,7 +210,7 @@ async def presentation_generation_stream(presentation_id: str, session: str):
 
 
 @presentation_router.post("/presentation/thumbnail", response_model=PresentationAndPath)
-async def update_presentation(
+async def update_presentation_thumbnail(
     presentation_id: Annotated[str, Body()],
     thumbnail: Annotated[UploadFile, File()],
 ):
@@ -223,7 +226,7 @@ async def update_presentation(
 
 
 @presentation_router.post("/presentation/theme")
-async def update_presentation(
+async def update_presentation_theme(
     data: UpdatePresentationThemeRequest,
 ):
     request_utils = RequestUtils(f"{route_prefix}/presentation/theme")
@@ -238,7 +241,7 @@ async def update_presentation(
 
 
 @presentation_router.post("/edit", response_model=SlideModel)
-async def update_presentation(
+async def edit_presentation_slide(
     data: EditPresentationSlideRequest,
 ):
     request_utils = RequestUtils(f"{route_prefix}/edit")
@@ -339,10 +342,7 @@ async def generate_presentation(data: Annotated[GeneratePresentationRequest, For
     logging_service, log_metadata = await request_utils.initialize_logger(
         presentation_id=presentation_id,
     )
-    return await handle_errors(
-        GeneratePresentationHandler(presentation_id, data).post,
-        logging_service,
-        log_metadata,
-    )
+    async with GeneratePresentationHandler(presentation_id, data) as handler:
+        return await handle_errors(handler.post, logging_service, log_metadata)
 
 
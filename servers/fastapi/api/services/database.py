@@ -10,7 +10,7 @@ sql_engine = create_engine(sql_url, connect_args={"check_same_thread": False})
 
 @contextmanager
 def get_sql_session():
-    session = Session(sql_engine)
+    session = Session(sql_engine, expire_on_commit=False)
     try:
         yield session
     finally:
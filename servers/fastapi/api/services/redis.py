@@ -65,9 +65,11 @@ class RedisService:
 
     def set_list(self, name: str, values: list) -> bool:
         try:
-            self.client.delete(name)
+            pipe = self.client.pipeline()
+            pipe.delete(name)
             if values:
-                self.client.rpush(name, *values)
+                pipe.rpush(name, *values)
+            pipe.execute()
             return True
         except RedisError:
             return False
@@ -11,7 +11,7 @@ class TempFileService:
         os.makedirs(self.base_dir, exist_ok=True)
 
     def create_dir_in_dir(self, base_dir: str, dir_name: Optional[str] = None) -> str:
-        temp_dir = os.path.join(base_dir, dir_name if dir_name else str(uuid.uuid4()))
+        temp_dir = os.path.join(base_dir, dir_name if dir_name else uuid.uuid4().hex)
         os.makedirs(temp_dir, exist_ok=True)
         return temp_dir
 
@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+from api.services.database import get_sql_session
+from api.sql_models import KeyValueSqlModel
+
+# Cached LLM responses are reused for this many seconds, 0 disables caching
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL") or 0)
+
+
+def get_llm_cache_key(*args) -> str:
+    digest = hashlib.sha256(json.dumps(args, default=str).encode()).hexdigest()
+    return f"llm-cache-{digest}"
+
+
+def _get_cached_llm_response(key: str) -> Optional[Any]:
+    with get_sql_session() as sql_session:
+        cached = sql_session.get(KeyValueSqlModel, key)
+        if not cached:
+            return None
+
+        # Expired responses are deleted when read so they don't pile up
+        if time.time() - cached.value["created_at"] > LLM_CACHE_TTL:
+            sql_session.delete(cached)
+            sql_session.commit()
+            return None
+        return cached.value["response"]
+
+
+def _set_cached_llm_response(key: str, response: Any):
+    with get_sql_session() as sql_session:
+        sql_session.merge(
+            KeyValueSqlModel(
+                id=key,
+                key=key,
+                value={"created_at": time.time(), "response": response},
+            )
+        )
+        sql_session.commit()
+
+
+# SQLite sessions block, so they run in a thread instead of on the event loop
+async def get_cached_llm_response(key: str) -> Optional[Any]:
+    if not LLM_CACHE_TTL:
+        return None
+    return await asyncio.to_thread(_get_cached_llm_response, key)
+
+
+async def set_cached_llm_response(key: str, response: Any):
+    if not LLM_CACHE_TTL:
+        return
+    await asyncio.to_thread(_set_cached_llm_response, key, response)
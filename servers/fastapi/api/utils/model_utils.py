@@ -1,10 +1,12 @@
+from functools import lru_cache
 import json
 import os
 from typing import AsyncGenerator, Optional
 
 import aiohttp
 from fastapi import HTTPException
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 import openai
 
 from api.models import SelectedLLMProvider
@@ -14,9 +16,10 @@ from api.models import SelectedLLMProvider
 
 
 
+@lru_cache(maxsize=1)
 def get_selected_llm_provider() -> SelectedLLMProvider:
     provider = os.getenv("LLM", "openai").lower()
-    if provider in ["google", "gemini"]:
+    if provider in ("google", "gemini"):
         return SelectedLLMProvider.GOOGLE
     else:
         # Default to OpenAI
@@ -25,62 +28,83 @@ def get_selected_llm_provider() -> SelectedLLMProvider:
 
 
 
-def get_model_base_url():
-    selected_llm = get_selected_llm_provider()
+LLM_BASE_URLS = {
+    SelectedLLMProvider.OPENAI: "https://api.openai.com/v1",
+    SelectedLLMProvider.GOOGLE: "https://generativelanguage.googleapis.com/v1beta/openai",
+}
 
-    if selected_llm == SelectedLLMProvider.OPENAI:
-        return "https://api.openai.com/v1"
-    elif selected_llm == SelectedLLMProvider.GOOGLE:
-        return "https://generativelanguage.googleapis.com/v1beta/openai"
-    else:
+LLM_API_KEY_ENV_VARS = {
+    SelectedLLMProvider.OPENAI: "OPENAI_API_KEY",
+    SelectedLLMProvider.GOOGLE: "GOOGLE_API_KEY",
+}
+
+LARGE_MODELS = {
+    SelectedLLMProvider.OPENAI: "gpt-4o",
+    SelectedLLMProvider.GOOGLE: "gemini-1.5-pro",
+}
+
+SMALL_MODELS = {
+    SelectedLLMProvider.OPENAI: "gpt-4o-mini",
+    SelectedLLMProvider.GOOGLE: "gemini-1.5-flash",
+}
+
+NANO_MODELS = {
+    SelectedLLMProvider.OPENAI: "gpt-4o-mini",  # Use mini for nano as well
+    SelectedLLMProvider.GOOGLE: "gemini-1.5-flash",
+}
+
+
+def get_model_base_url():
+    base_url = LLM_BASE_URLS.get(get_selected_llm_provider())
+    if not base_url:
         raise ValueError(f"Invalid LLM provider")
+    return base_url
 
 
 def get_llm_api_key():
-    selected_llm = get_selected_llm_provider()
-    if selected_llm == SelectedLLMProvider.OPENAI:
-        return os.getenv("OPENAI_API_KEY")
-    elif selected_llm == SelectedLLMProvider.GOOGLE:
-        return os.getenv("GOOGLE_API_KEY")
-    else:
+    api_key_env_var = LLM_API_KEY_ENV_VARS.get(get_selected_llm_provider())
+    if not api_key_env_var:
         raise ValueError(f"Invalid LLM API key")
+    return os.getenv(api_key_env_var)
 
 
-def get_llm_client():
-    client = AsyncOpenAI(
-        base_url=get_model_base_url(),
-        api_key=get_llm_api_key(),
+# Generation fans out many concurrent requests (document summaries, slide edits),
+# so more idle connections are kept alive than the client's default of 100
+LLM_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=1000, max_keepalive_connections=256
+)
+
+
+@lru_cache(maxsize=4)
+def _create_llm_client(base_url: str, api_key: Optional[str]) -> AsyncOpenAI:
+    return AsyncOpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=LLM_CONNECTION_LIMITS),
     )
-    return client
+
+
+def get_llm_client():
+    # Clients are shared per base url and api key so connections are reused
+    return _create_llm_client(get_model_base_url(), get_llm_api_key())
 
 
 def get_large_model():
-    selected_llm = get_selected_llm_provider()
-    if selected_llm == SelectedLLMProvider.OPENAI:
-        return "gpt-4o"
-    elif selected_llm == SelectedLLMProvider.GOOGLE:
-        return "gemini-1.5-pro"
-    else:
+    model = LARGE_MODELS.get(get_selected_llm_provider())
+    if not model:
         raise ValueError(f"Invalid LLM model")
+    return model
 
 
 def get_small_model():
-    selected_llm = get_selected_llm_provider()
-    if selected_llm == SelectedLLMProvider.OPENAI:
-        return "gpt-4o-mini"
-    elif selected_llm == SelectedLLMProvider.GOOGLE:
-        return "gemini-1.5-flash"
-    else:
+    model = SMALL_MODELS.get(get_selected_llm_provider())
+    if not model:
         raise ValueError(f"Invalid LLM model")
+    return model
 
 
 def get_nano_model():
-    selected_llm = get_selected_llm_provider()
-    if selected_llm == SelectedLLMProvider.OPENAI:
-        return "gpt-4o-mini"  # Use mini for nano as well
-    elif selected_llm == SelectedLLMProvider.GOOGLE:
-        return "gemini-1.5-flash"
-    else:
+    model = NANO_MODELS.get(get_selected_llm_provider())
+    if not model:
         raise ValueError(f"Invalid LLM model")
-
-
+    return model
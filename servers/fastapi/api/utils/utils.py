@@ -1,8 +1,8 @@
 import asyncio
 import json
+import logging
 import os
 import sys
-import traceback
 import re
 from typing import List, Optional
 
@@ -12,6 +12,9 @@ from fastapi.responses import StreamingResponse
 
 from api.models import LogMetadata, UserConfig
 from api.services.logging import LoggingService
+from api.utils.model_utils import get_selected_llm_provider
+
+logger = logging.getLogger(__name__)
 
 
 def get_presentation_dir(presentation_id: str) -> str:
@@ -37,8 +40,7 @@ def get_user_config():
             with open(user_config_path, "r") as f:
                 existing_config = UserConfig(**json.load(f))
     except Exception as e:
-        print("Error while loading user config")
-        pass
+        logger.warning("Error while loading user config: %s", e)
 
     return UserConfig(
         LLM=existing_config.LLM or os.getenv("LLM"),
@@ -48,25 +50,44 @@ def get_user_config():
     )
 
 
+# Modification time of the user config last applied to the environment
+_applied_user_config_mtime = None
+
+
 def update_env_with_user_config():
+    # The user config is shared by every request, so the environment only has
+    # to be updated when the config file has changed since it was last applied
+    global _applied_user_config_mtime
+    user_config_path = os.getenv("USER_CONFIG_PATH")
+    try:
+        mtime = os.path.getmtime(user_config_path)
+    except (OSError, TypeError):
+        mtime = -1
+    if mtime == _applied_user_config_mtime:
+        return
+    _applied_user_config_mtime = mtime
+
     user_config = get_user_config()
-    if user_config.LLM:
+    if user_config.LLM and user_config.LLM != os.getenv("LLM"):
         os.environ["LLM"] = user_config.LLM
-    if user_config.OPENAI_API_KEY:
-        os.environ["OPENAI_API_KEY"] = user_config.OPENAI_API_KEY
-    if user_config.GOOGLE_API_KEY:
-        os.environ["GOOGLE_API_KEY"] = user_config.GOOGLE_API_KEY
-    if user_config.PEXELS_API_KEY:
-        os.environ["PEXELS_API_KEY"] = user_config.PEXELS_API_KEY
+        get_selected_llm_provider.cache_clear()
+    # Keys are only written when changed, since each write also calls putenv
+    for key_name in ("OPENAI_API_KEY", "GOOGLE_API_KEY", "PEXELS_API_KEY"):
+        api_key = getattr(user_config, key_name)
+        if api_key and api_key != os.getenv(key_name):
+            os.environ[key_name] = api_key
+
+
+# Base path of bundled resources never changes, so it is resolved only once
+RESOURCES_BASE_PATH = getattr(
+    sys,
+    "_MEIPASS",
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+)
 
 
 def get_resource(relative_path):
-    base_path = getattr(
-        sys,
-        "_MEIPASS",
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    )
-    return os.path.join(base_path, relative_path)
+    return os.path.join(RESOURCES_BASE_PATH, relative_path)
 
 
 def replace_file_name(old_name: str, new_name: str) -> str:
@@ -89,38 +110,53 @@ def save_uploaded_files(
     return full_file_paths
 
 
-async def download_file(url: str, save_path: str, headers: Optional[dict] = None):
+async def download_file(
+    url: str,
+    save_path: str,
+    headers: Optional[dict] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+):
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await download_file(url, save_path, headers, session, timeout)
+
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    with open(save_path, "wb") as file:
-                        while True:
-                            chunk = await response.content.read(1024)
-                            if not chunk:
-                                break
-                            file.write(chunk)
-                    print(f"File downloaded successfully to {save_path}")
-                    return True
-                else:
-                    print(f"Failed to download file. HTTP status: {response.status}")
-                    return False
+        # The session's default timeout applies unless the caller sets one
+        async with session.get(
+            url, headers=headers, **({"timeout": timeout} if timeout else {})
+        ) as response:
+            if response.status == 200:
+                # File writes run in a thread to keep the event loop free
+                file = await asyncio.to_thread(open, save_path, "wb")
+                try:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        await asyncio.to_thread(file.write, chunk)
+                finally:
+                    await asyncio.to_thread(file.close)
+                logger.debug("File downloaded successfully to %s", save_path)
+                return True
+            else:
+                logger.warning(
+                    "Failed to download file. HTTP status: %s", response.status
+                )
+                return False
     except Exception as e:
-        print(e)
-        print(f"Error while downloading file from {url} to {save_path}")
+        logger.warning(
+            "Error while downloading file from %s to %s: %s", url, save_path, e
+        )
         return False
 
 
 async def download_files(urls: List[str], save_paths: List[str]):
-    for url, save_path in zip(urls, save_paths):
-        print(url)
-        print(save_path)
-        print("-" * 10)
-    coroutines = [
-        download_file(url, save_paths[index]) for index, url in enumerate(urls)
-    ]
-    await asyncio.gather(*coroutines)
+    # All downloads share one session so connections are reused between them
+    async with aiohttp.ClientSession() as session:
+        coroutines = [
+            download_file(url, save_paths[index], session=session)
+            for index, url in enumerate(urls)
+        ]
+        await asyncio.gather(*coroutines)
 
 
 async def handle_errors(
@@ -144,9 +180,6 @@ async def handle_errors(
         )
         raise e
     except Exception as e:
-        print(traceback.print_stack())
-        print(traceback.print_exc())
-
         log_metadata.status_code = 400
         logging_service.logger.critical(
             "Unhandled Exception",
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Optional
 from pydantic import Field
 from ppt_config_generator.models import (
@@ -16,6 +17,8 @@ class SlideMarkdownModelWithValidation(SlideMarkdownModel):
     )
 
 
+# Models are cached per slide count since building a pydantic model is costly
+@lru_cache(maxsize=32)
 def get_presentation_markdown_model_with_n_slides(n_slides: int):
     class PresentationMarkdownModelWithNSlides(PresentationMarkdownModel):
         title: str = Field(
@@ -35,6 +38,7 @@ def get_presentation_markdown_model_with_n_slides(n_slides: int):
     return PresentationMarkdownModelWithNSlides
 
 
+@lru_cache(maxsize=32)
 def get_presentation_structure_model_with_n_slides(n_slides: int):
     class PresentationStructureModelWithNSlides(PresentationStructureModel):
         slides: List[SlideStructureModel] = Field(
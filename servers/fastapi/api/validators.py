@@ -1,4 +1,4 @@
-from typing import List
+from typing import Collection, List
 
 from fastapi import HTTPException, UploadFile
 
@@ -8,13 +8,14 @@ def validate_files(
     nullable: bool,
     multiple: bool,
     max_size: int,
-    accepted_types: List[str],
+    accepted_types: Collection[str],
 ):
 
     if field:
         files: List[UploadFile] = field if multiple else [field]
+        max_size_bytes = max_size * 1024 * 1024
         for each_file in files:
-            if (max_size * 1024 * 1024) < each_file.size:
+            if max_size_bytes < each_file.size:
                 raise HTTPException(
                     400,
                     f"File '{each_file.filename}' exceeded max upload size of {max_size} MB",
@@ -9,18 +9,20 @@ from docx import Document as DocxDocument
 
 from image_processor.utils import get_page_images_from_pdf_async
 
-PDF_MIME_TYPES = ["application/pdf"]
-TEXT_MIME_TYPES = ["text/plain"]
-POWERPOINT_TYPES = [
-    "application/vnd.openxmlformats-officedocument.presentationml.presentation"
-]
-WORD_TYPES = [
-    "application/msword",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-]
-SPREADSHEET_TYPES = ["text/csv", "application/csv"]
+PDF_MIME_TYPES = frozenset({"application/pdf"})
+TEXT_MIME_TYPES = frozenset({"text/plain"})
+POWERPOINT_TYPES = frozenset(
+    {"application/vnd.openxmlformats-officedocument.presentationml.presentation"}
+)
+WORD_TYPES = frozenset(
+    {
+        "application/msword",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    }
+)
+SPREADSHEET_TYPES = frozenset({"text/csv", "application/csv"})
 UPLOAD_ACCEPTED_DOCUMENTS = (
-    PDF_MIME_TYPES + TEXT_MIME_TYPES + POWERPOINT_TYPES + WORD_TYPES
+    PDF_MIME_TYPES | TEXT_MIME_TYPES | POWERPOINT_TYPES | WORD_TYPES
 )
 
 
@@ -46,35 +48,45 @@ class DocumentsLoader:
         load_text: bool = True,
         load_images: bool = False,
     ):
-        documents: List[str] = []
-        images: List[str] = []
-
         for file_path in self._document_paths:
             if not os.path.exists(file_path):
                 raise HTTPException(
                     status_code=404, detail=f"File {file_path} not found"
                 )
 
-            document = ""
-            imgs = []
-
-            mime_type = mimetypes.guess_type(file_path)[0]
-            if mime_type in PDF_MIME_TYPES:
-                document, imgs = await self.load_pdf(
-                    file_path, load_text, load_images, temp_dir
-                )
-            elif mime_type in TEXT_MIME_TYPES:
-                document = await self.load_text(file_path)
-            elif mime_type in POWERPOINT_TYPES:
-                document = self.load_powerpoint(file_path)
-            elif mime_type in WORD_TYPES:
-                document = self.load_msword(file_path)
+        loaded_documents = await asyncio.gather(
+            *[
+                self.load_document(file_path, load_text, load_images, temp_dir)
+                for file_path in self._document_paths
+            ]
+        )
 
-            documents.append(document)
-            images.append(imgs)
+        self._documents = [document for document, _ in loaded_documents]
+        self._images = [imgs for _, imgs in loaded_documents]
 
-        self._documents = documents
-        self._images = images
+    async def load_document(
+        self,
+        file_path: str,
+        load_text: bool,
+        load_images: bool,
+        temp_dir: str,
+    ) -> Tuple[str, List[str]]:
+        document = ""
+        imgs = []
+
+        mime_type = mimetypes.guess_type(file_path)[0]
+        if mime_type in PDF_MIME_TYPES:
+            document, imgs = await self.load_pdf(
+                file_path, load_text, load_images, temp_dir
+            )
+        elif mime_type in TEXT_MIME_TYPES:
+            document = await self.load_text(file_path)
+        elif mime_type in POWERPOINT_TYPES:
+            document = await asyncio.to_thread(self.load_powerpoint, file_path)
+        elif mime_type in WORD_TYPES:
+            document = await asyncio.to_thread(self.load_msword, file_path)
+
+        return document, imgs
 
     async def load_pdf(
         self,
@@ -86,16 +98,26 @@ class DocumentsLoader:
         image_paths = []
         document: str = ""
 
+        # Text and page images are extracted concurrently
+        coroutines = []
         if load_text:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    document += await asyncio.to_thread(page.extract_text)
+            coroutines.append(asyncio.to_thread(self.load_pdf_text, file_path))
+        if load_images:
+            coroutines.append(get_page_images_from_pdf_async(file_path, temp_dir))
 
+        results = await asyncio.gather(*coroutines)
+
+        if load_text:
+            document = results[0]
         if load_images:
-            image_paths = await get_page_images_from_pdf_async(file_path, temp_dir)
+            image_paths = results[-1]
 
         return document, image_paths
 
+    def load_pdf_text(self, file_path: str) -> str:
+        with pdfplumber.open(file_path) as pdf:
+            return "".join(page.extract_text() for page in pdf.pages)
+
     async def load_text(self, file_path: str) -> str:
         with open(file_path, "r") as file:
             return await asyncio.to_thread(file.read)
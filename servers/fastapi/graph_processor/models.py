@@ -72,10 +72,13 @@ class PieChartDataModel(BaseModel):
         min_length=1,
     )
 
-    @model_validator(mode="after")
-    def limit_series(self):
-        self.series = self.series[:1]
-        return self
+    @model_validator(mode="before")
+    @classmethod
+    def limit_series(cls, data):
+        # Only the first series is used, so the rest are dropped before validation
+        if isinstance(data, dict) and isinstance(data.get("series"), list):
+            data = {**data, "series": data["series"][:1]}
+        return data
 
 
 class GraphTypeEnum(Enum):
@@ -100,12 +103,13 @@ class GraphModel(LLMGraphModel):
     def from_llm_graph_model(
         cls, llm_graph_model: LLMGraphModel, style: Optional[dict] = {}
     ):
-        return cls(
+        # The llm graph model is already validated, so it isn't validated again
+        return cls.model_construct(
             name=llm_graph_model.name,
             type=llm_graph_model.type,
             unit=llm_graph_model.unit,
             data=llm_graph_model.data,
-            style=style,
+            style=dict(style or {}),
         )
 
 
@@ -1,29 +1,36 @@
-from typing import List, Optional
+import logging
+from typing import TYPE_CHECKING, List, Optional
 
 from api.utils.utils import get_resource
 from ppt_generator.models.query_and_prompt_models import (
     IconCategoryEnum,
     IconQueryCollectionWithData,
 )
-from fastembed_vectorstore import FastembedVectorstore
+
+if TYPE_CHECKING:
+    from fastembed_vectorstore import FastembedVectorstore
+
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_ICON_PATH = get_resource("assets/icons/placeholder.png")
 
 
 async def get_icon(
-    vector_store: FastembedVectorstore,
+    vector_store: "FastembedVectorstore",
     input: IconQueryCollectionWithData,
 ) -> str:
     try:
         query = input.icon_query
         results = vector_store.search(query, 1)
-        icon_name = results[0][0].split("||")[0]
+        icon_name = results[0][0].partition("||")[0]
         return get_resource(f"assets/icons/bold/{icon_name}.png")
     except Exception as e:
-        print("Error finding icon: ", e)
-        return get_resource("assets/icons/placeholder.png")
+        logger.warning("Error finding icon: %s", e)
+        return PLACEHOLDER_ICON_PATH
 
 
 async def get_icons(
-    vector_store: FastembedVectorstore,
+    vector_store: "FastembedVectorstore",
     query: str,
     page: int,
     limit: int,
@@ -32,6 +39,6 @@ async def get_icons(
 ) -> List[str]:
 
     results = vector_store.search(query, limit)
-    icon_names = [result[0].split("||")[0] for result in results]
+    icon_names = [result[0].partition("||")[0] for result in results]
 
     return [get_resource(f"assets/icons/bold/{each}.png") for each in icon_names]
@@ -1,11 +1,29 @@
 import json
 import os
+import threading
 
 from api.utils.utils import get_resource
-from fastembed_vectorstore import FastembedVectorstore, FastembedEmbeddingModel
+
+
+_icons_vectorstore = None
+_icons_vectorstore_lock = threading.Lock()
 
 
 def get_icons_vectorstore():
+    # Loaded once, the lock keeps the startup warm up and a request that needs
+    # icons before it finishes from both building the vector store
+    global _icons_vectorstore
+    if _icons_vectorstore is None:
+        with _icons_vectorstore_lock:
+            if _icons_vectorstore is None:
+                _icons_vectorstore = load_icons_vectorstore()
+    return _icons_vectorstore
+
+
+def load_icons_vectorstore():
+    # Imported here so the embedding runtime isn't loaded while the app starts
+    from fastembed_vectorstore import FastembedVectorstore, FastembedEmbeddingModel
+
     vector_store_path = get_resource("assets/icons_vectorstore.json")
     embedding_model = FastembedEmbeddingModel.BGESmallENV15
 
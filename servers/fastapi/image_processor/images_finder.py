@@ -1,16 +1,79 @@
 import asyncio
+from collections import OrderedDict
+import logging
 import os
+import shutil
 import uuid
 import aiohttp
-import time
-from typing import Optional, Literal
+import orjson
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from typing import Dict, Optional, Tuple
 from enum import Enum
 
 from ppt_generator.models.query_and_prompt_models import (
+    ImageAspectRatio,
     ImagePromptWithThemeAndAspectRatio,
 )
 from api.utils.utils import download_file, get_resource
 
+logger = logging.getLogger(__name__)
+
+PLACEHOLDER_IMAGE_PATH = get_resource("assets/images/placeholder.jpg")
+
+# Delays in seconds between polls for a FLUX result
+FLUX_POLL_INITIAL_DELAY = 0.5
+FLUX_POLL_MAX_DELAY = 8.0
+FLUX_POLL_TIMEOUT = 120
+
+# HTTP statuses for which submitting a FLUX request is retried
+FLUX_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# FLUX statuses after which polling will never return an image
+FLUX_FAILED_STATUSES = frozenset(
+    {"Error", "Failed", "Content Moderated", "Request Moderated", "Task not found"}
+)
+
+# Per request timeouts so a stalled connection can't hold a FLUX_SEMAPHORE slot
+FLUX_SUBMIT_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5)
+FLUX_POLL_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+IMAGE_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_read=20)
+
+# Limits in-flight FLUX generations so large decks don't trigger rate limits
+FLUX_SEMAPHORE = asyncio.Semaphore(int(os.getenv("FLUX_CONCURRENCY") or 5))
+
+# Recently generated images and in progress generations by prompt, so the
+# same prompt is only generated once
+IMAGES_CACHE_SIZE = 1024
+_generated_images: "OrderedDict[Tuple[str, ImageAspectRatio], str]" = OrderedDict()
+_pending_images: Dict[Tuple[str, ImageAspectRatio], asyncio.Task] = {}
+# Number of callers awaiting each pending generation
+_pending_images_waiters: Dict[Tuple[str, ImageAspectRatio], int] = {}
+
+# Shared by all image requests so connections are kept alive between polls
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=32, ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=None, connect=10, sock_read=30),
+        )
+    return _http_session
+
+
+async def close_http_session():
+    if _http_session is not None:
+        await _http_session.close()
+
 
 class FluxModel(Enum):
     KONTEXT_MAX = ("flux-kontext-max", 0.08)
@@ -25,24 +88,142 @@ class FluxModel(Enum):
         self.price = price
 
 
+# FLUX settings are only provided through the environment, so read them once
+BFL_API_KEY = os.getenv("BFL_API_KEY")
+FLUX_DEFAULT_MODEL = FluxModel.__members__.get(os.getenv("FLUX_MODEL", "DEV"), FluxModel.DEV)
+FLUX_RAW_MODE = os.getenv("FLUX_RAW_MODE", "false").lower() == "true"
+
+
 async def generate_image(
     input: ImagePromptWithThemeAndAspectRatio,
     output_directory: str,
+    use_cache: bool = True,
 ) -> str:
     # Combine image prompt with theme prompt for better results
     image_prompt = f"{input.image_prompt}, {input.theme_prompt}"
-    print(f"Request - Generating Image for {image_prompt}")
+    logger.debug("Request - Generating Image for %s", image_prompt)
 
     try:
-        # Always use FLUX for image generation
-        image_path = await generate_image_flux(image_prompt, output_directory)
+        # Always use FLUX for image generation. Explicit regenerations skip
+        # the cache so the same prompt gives a new image.
+        if use_cache:
+            image_path = await generate_image_once(
+                image_prompt, input.aspect_ratio, output_directory
+            )
+        else:
+            image_path = await generate_image_flux_limited(
+                image_prompt, output_directory
+            )
         if image_path and os.path.exists(image_path):
             return image_path
         raise Exception(f"Image not found at {image_path}")
 
     except Exception as e:
-        print(f"Error generating image: {e}")
-        return get_resource("assets/images/placeholder.jpg")
+        logger.warning("Error generating image: %s", e)
+        return PLACEHOLDER_IMAGE_PATH
+
+
+async def generate_image_once(
+    prompt: str, aspect_ratio: ImageAspectRatio, output_directory: str
+) -> str:
+    # Prompts differing only in case or whitespace share the same image
+    key = (" ".join(prompt.lower().split()), aspect_ratio)
+    image_path = _generated_images.get(key)
+    if image_path and os.path.exists(image_path):
+        _generated_images.move_to_end(key)
+    else:
+        task = _pending_images.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                generate_image_flux_limited(prompt, output_directory)
+            )
+            _pending_images[key] = task
+            task.add_done_callback(lambda _: _pending_images.pop(key, None))
+
+        # The generation is shared, so it is only cancelled along with its
+        # last waiter, e.g. when every stream that needed it was disconnected
+        _pending_images_waiters[key] = _pending_images_waiters.get(key, 0) + 1
+        try:
+            image_path = await asyncio.shield(task)
+        finally:
+            _pending_images_waiters[key] -= 1
+            if not _pending_images_waiters[key]:
+                del _pending_images_waiters[key]
+                if not task.done():
+                    task.cancel()
+
+        _generated_images[key] = image_path
+        _generated_images.move_to_end(key)
+        if len(_generated_images) > IMAGES_CACHE_SIZE:
+            _generated_images.popitem(last=False)
+
+    # Images generated for another presentation are copied into this one
+    if os.path.normpath(os.path.dirname(image_path)) != os.path.normpath(
+        output_directory
+    ):
+        copied_image_path = os.path.join(
+            output_directory, f"{uuid.uuid4().hex}{os.path.splitext(image_path)[1]}"
+        )
+        await asyncio.to_thread(link_or_copy_file, image_path, copied_image_path)
+        image_path = copied_image_path
+
+    return image_path
+
+
+def link_or_copy_file(source_path: str, destination_path: str):
+    # Hardlinks avoid copying the image when both are on the same filesystem
+    try:
+        os.link(source_path, destination_path)
+    except OSError:
+        shutil.copyfile(source_path, destination_path)
+
+
+async def generate_image_flux_limited(prompt: str, output_directory: str) -> str:
+    async with FLUX_SEMAPHORE:
+        return await generate_image_flux(prompt, output_directory)
+
+
+class FluxRetryableError(Exception):
+    pass
+
+
+@retry(
+    retry=retry_if_exception_type(
+        (aiohttp.ClientError, asyncio.TimeoutError, FluxRetryableError)
+    ),
+    wait=wait_exponential_jitter(initial=1, max=16),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+async def submit_flux_request(
+    session: aiohttp.ClientSession, model: FluxModel, headers: dict, payload: dict
+) -> Tuple[str, str]:
+    """Submit a FLUX generation, returns its request id and polling url"""
+    async with session.post(
+        f'https://api.bfl.ai/v1/{model.endpoint}',
+        headers=headers,
+        json=payload,
+        timeout=FLUX_SUBMIT_TIMEOUT,
+    ) as response:
+        if response.status == 402:
+            # Insufficient credits
+            raise Exception("Insufficient credits. Please add credits to your BFL account.")
+
+        elif response.status in FLUX_RETRY_STATUSES:
+            # Rate limited or temporarily unavailable, retried with backoff
+            raise FluxRetryableError(f"FLUX API error: {response.status}")
+
+        elif response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"FLUX API error: {response.status} - {error_text}")
+
+        data = await response.json(loads=orjson.loads)
+
+    polling_url = data.get("polling_url")
+    if not polling_url:
+        raise Exception("No polling URL received from FLUX API")
+
+    return data.get("id"), polling_url
 
 
 async def generate_image_flux(
@@ -53,103 +234,80 @@ async def generate_image_flux(
     """Generate image using FLUX API"""
     # Use the model specified in environment or default to DEV
     if model is None:
-        model_name = os.getenv("FLUX_MODEL", "DEV")
-        model = FluxModel[model_name] if hasattr(FluxModel, model_name) else FluxModel.DEV
+        model = FLUX_DEFAULT_MODEL
     
-    api_key = os.getenv("BFL_API_KEY")
+    api_key = BFL_API_KEY
     if not api_key:
         raise Exception("BFL_API_KEY environment variable is not set")
     
-    print(f"Using FLUX model: {model.name} (${model.price}/image)")
+    logger.debug("Using FLUX model: %s ($%s/image)", model.name, model.price)
     
-    # Make the initial request to FLUX API with retry logic
-    async with aiohttp.ClientSession() as session:
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                async with session.post(
-                    f'https://api.bfl.ai/v1/{model.endpoint}',
-                    headers={
-                        'accept': 'application/json',
-                        'x-key': api_key,
-                        'Content-Type': 'application/json',
-                    },
-                    json={
-                        'prompt': prompt,
-                        # Add raw mode for ultra model if needed
-                        'raw': model == FluxModel.PRO_1_1_ULTRA and os.getenv("FLUX_RAW_MODE", "false").lower() == "true"
-                    }
-                ) as response:
-                    if response.status == 429:
-                        # Rate limit exceeded, wait and retry
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        print(f"Rate limited, waiting {wait_time}s before retry...")
-                        await asyncio.sleep(wait_time)
-                        continue
-                    
-                    elif response.status == 402:
-                        # Insufficient credits
-                        raise Exception("Insufficient credits. Please add credits to your BFL account.")
-                    
-                    elif response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"FLUX API error: {response.status} - {error_text}")
-                    
-                    data = await response.json()
-                    request_id = data.get("id")
-                    polling_url = data.get("polling_url")
-                    
-                    if not polling_url:
-                        raise Exception("No polling URL received from FLUX API")
-                    
-                    break  # Success, exit retry loop
-                    
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                await asyncio.sleep(2 ** attempt)
-        
-        # Poll for the result
-        max_attempts = 60  # 60 attempts with 2 second delays = 2 minutes max
-        for attempt in range(max_attempts):
-            await asyncio.sleep(2)  # Wait 2 seconds between polls
-            
-            async with session.get(
-                polling_url,
-                headers={
-                    'accept': 'application/json',
-                    'x-key': api_key,
-                },
-                params={'id': request_id}
-            ) as poll_response:
-                if poll_response.status != 200:
-                    continue
-                    
-                poll_data = await poll_response.json()
+    headers = {
+        'accept': 'application/json',
+        'x-key': api_key,
+        'Content-Type': 'application/json',
+    }
+    payload = {
+        'prompt': prompt,
+        # Add raw mode for ultra model if needed
+        'raw': model == FluxModel.PRO_1_1_ULTRA and FLUX_RAW_MODE
+    }
+
+    session = get_http_session()
+
+    request_id, polling_url = await submit_flux_request(
+        session, model, headers, payload
+    )
+
+    # Poll for the result with exponential backoff, 2 minutes max
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + FLUX_POLL_TIMEOUT
+    delay = FLUX_POLL_INITIAL_DELAY
+    while loop.time() < deadline:
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, FLUX_POLL_MAX_DELAY)
+
+        async with session.get(
+            polling_url,
+            headers={
+                'accept': 'application/json',
+                'x-key': api_key,
+            },
+            params={'id': request_id},
+            timeout=FLUX_POLL_REQUEST_TIMEOUT,
+        ) as poll_response:
+            if poll_response.status == 404:
+                raise Exception("FLUX task not found")
+            if poll_response.status != 200:
+                retry_after = poll_response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                continue
                 
-                if poll_data.get("status") == "Ready":
-                    # According to FLUX docs, the image URL is at result.sample
-                    result = poll_data.get("result", {})
-                    image_url = result.get("sample")
-                    
-                    if image_url:
-                        # Download the image
-                        async with session.get(image_url) as image_response:
-                            if image_response.status == 200:
-                                image_bytes = await image_response.read()
-                                image_path = os.path.join(output_directory, f"{str(uuid.uuid4())}.jpg")
-                                with open(image_path, "wb") as f:
-                                    f.write(image_bytes)
-                                print(f"Image saved to: {image_path}")
-                                return image_path
-                            else:
-                                raise Exception(f"Failed to download image from FLUX: HTTP {image_response.status}")
-                    else:
-                        print(f"FLUX response structure: {poll_data}")
-                        raise Exception("No image URL in FLUX response")
+            poll_data = await poll_response.json(loads=orjson.loads)
+            
+            if poll_data.get("status") == "Ready":
+                # According to FLUX docs, the image URL is at result.sample
+                result = poll_data.get("result", {})
+                image_url = result.get("sample")
                 
-                elif poll_data.get("status") in ["Error", "Failed"]:
-                    error_msg = poll_data.get("error", "Unknown error")
-                    raise Exception(f"FLUX generation error: {error_msg}")
-        
-        raise Exception("FLUX image generation timed out after 2 minutes")
+                if image_url:
+                    image_path = os.path.join(output_directory, f"{uuid.uuid4().hex}.jpg")
+                    if not await download_file(
+                        image_url,
+                        image_path,
+                        session=session,
+                        timeout=IMAGE_DOWNLOAD_TIMEOUT,
+                    ):
+                        raise Exception("Failed to download image from FLUX")
+                    logger.debug("Image saved to: %s", image_path)
+                    return image_path
+                else:
+                    logger.warning("FLUX response structure: %s", poll_data)
+                    raise Exception("No image URL in FLUX response")
+            
+            elif poll_data.get("status") in FLUX_FAILED_STATUSES:
+                error_msg = poll_data.get("error", "Unknown error")
+                raise Exception(f"FLUX generation error: {error_msg}")
+    
+    raise Exception("FLUX image generation timed out after 2 minutes")
@@ -1,5 +1,8 @@
 import asyncio
+from itertools import islice
+import re
 from typing import List
+from openai import AsyncOpenAI
 from openai.types.chat.chat_completion import ChatCompletion
 
 from api.utils.model_utils import get_llm_client, get_nano_model
@@ -21,24 +24,38 @@ Maintain as much information as possible.
 """
 
 
+# Documents shorter than the requested summary are used as they are, since
+# summarizing them would only pad the text and cost an extra LLM call
+SUMMARY_MIN_DOCUMENT_WORDS = 2000
+
+WORD_REGEX = re.compile(r"\S+")
+
+
+def has_more_words_than(text: str, n_words: int) -> bool:
+    # Stops at the first word past the limit instead of splitting the whole text
+    return next(islice(WORD_REGEX.finditer(text), n_words, None), None) is not None
+
+
+async def summarize_document(client: AsyncOpenAI, model: str, document: str) -> str:
+    if not has_more_words_than(document, SUMMARY_MIN_DOCUMENT_WORDS):
+        return document
+
+    truncated_text = document[:200000]
+    completion: ChatCompletion = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": sysmte_prompt},
+            {"role": "user", "content": truncated_text},
+        ],
+    )
+    return completion.choices[0].message.content
+
+
 async def generate_document_summary(documents: List[str]):
     client = get_llm_client()
     model = get_nano_model()
 
-    coroutines = []
-    for document in documents:
-        truncated_text = document[:200000]
-        coroutine = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": sysmte_prompt},
-                {"role": "user", "content": truncated_text},
-            ],
-        )
-        coroutines.append(coroutine)
-
-    completions: List[ChatCompletion] = await asyncio.gather(*coroutines)
-    combined = "\n\n\n\n".join(
-        [completion.choices[0].message.content for completion in completions]
+    summaries = await asyncio.gather(
+        *[summarize_document(client, model, document) for document in documents]
     )
-    return combined
+    return "\n\n\n\n".join(summaries)
@@ -27,14 +27,14 @@ class PresentationMarkdownModel(BaseModel):
     slides: List[SlideMarkdownModel] = Field(description="List of slides")
 
     def to_string(self):
-        message = f"# Presentation Title: {self.title} \n\n"
+        lines = [f"# Presentation Title: {self.title} \n\n"]
         for i, slide in enumerate(self.slides):
-            message += f"## Slide {i+1}:\n"
-            message += f"  - Title: {slide.title} \n"
-            message += f"  - Body: {slide.body} \n"
+            lines.append(f"## Slide {i+1}:\n")
+            lines.append(f"  - Title: {slide.title} \n")
+            lines.append(f"  - Body: {slide.body} \n")
 
         if self.notes:
-            message += f"# Notes: \n"
+            lines.append(f"# Notes: \n")
             for note in self.notes:
-                message += f"  - {note} \n"
-        return message
+                lines.append(f"  - {note} \n")
+        return "".join(lines)
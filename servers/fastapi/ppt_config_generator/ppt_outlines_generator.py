@@ -1,5 +1,10 @@
 from typing import Optional
 
+from api.utils.llm_cache import (
+    get_cached_llm_response,
+    get_llm_cache_key,
+    set_cached_llm_response,
+)
 from api.utils.model_utils import get_large_model, get_llm_client
 from api.utils.variable_length_models import (
     get_presentation_markdown_model_with_n_slides,
@@ -58,10 +63,19 @@ async def generate_ppt_content(
     model = get_large_model()
     response_model = get_presentation_markdown_model_with_n_slides(n_slides)
 
+    cache_key = get_llm_cache_key(
+        "outlines", model, prompt, n_slides, language, content
+    )
+    cached_response = await get_cached_llm_response(cache_key)
+    if cached_response is not None:
+        return response_model(**cached_response)
+
     response = await client.beta.chat.completions.parse(
         model=model,
         temperature=0.2,
         messages=get_prompt_template(prompt, n_slides, language, content),
         response_format=response_model,
     )
-    return response.choices[0].message.parsed
+    presentation_content = response.choices[0].message.parsed
+    await set_cached_llm_response(cache_key, presentation_content.model_dump(mode="json"))
+    return presentation_content
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from api.utils.model_utils import get_llm_client, get_small_model
 from api.utils.variable_length_models import (
     get_presentation_structure_model_with_n_slides,
@@ -8,11 +10,11 @@ from ppt_config_generator.models import (
 )
 
 
-def get_prompt(n_slides: int, data: str):
-    return [
-        {
-            "role": "system",
-            "content": f"""
+# The system prompt only depends on the number of slides, so it is built once
+# per slide count instead of on every request
+@lru_cache(maxsize=32)
+def get_system_prompt(n_slides: int) -> str:
+    return f"""
                 You're a professional presentation designer with years of experience in designing clear and engaging presentations.
 
                 # Slide Types
@@ -41,7 +43,14 @@ def get_prompt(n_slides: int, data: str):
                 - Select type for {n_slides} slides.
 
                 **Go through notes and steps and make sure they are all followed. Rule breaks are strictly not allowed.**
-            """,
+            """
+
+
+def get_prompt(n_slides: int, data: str):
+    return [
+        {
+            "role": "system",
+            "content": get_system_prompt(n_slides),
         },
         {
             "role": "user",
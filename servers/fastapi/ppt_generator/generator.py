@@ -1,6 +1,14 @@
+import logging
+import os
+import orjson
 from openai import AsyncStream
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from api.models import SelectedLLMProvider
+from api.utils.llm_cache import (
+    get_cached_llm_response,
+    get_llm_cache_key,
+    set_cached_llm_response,
+)
 from api.utils.model_utils import (
     get_large_model,
     get_llm_client,
@@ -11,6 +19,10 @@ from ppt_generator.models.llm_models_with_validations import (
     LLMPresentationModelWithValidation,
 )
 
+logger = logging.getLogger(__name__)
+
+# Low temperature keeps schema constrained presentation JSON consistent
+PRESENTATION_TEMPERATURE = float(os.getenv("PRESENTATION_TEMPERATURE") or 0.3)
 
 CREATE_PRESENTATION_PROMPT = """
     You're a professional presenter with years of experience in creating clear and engaging presentations. 
@@ -70,10 +82,14 @@ CREATE_PRESENTATION_PROMPT = """
     **Go through notes and steps and make sure they are all followed. Rule breaks are strictly not allowed.**
 """
 
+# The schema doesn't change at runtime, so it is only generated once
+PRESENTATION_SCHEMA = LLMPresentationModelWithValidation.model_json_schema()
+PRESENTATION_SCHEMA_JSON = orjson.dumps(PRESENTATION_SCHEMA).decode()
+
 system_prompt_with_schema = f"""
 {CREATE_PRESENTATION_PROMPT}
 
-Follow this schema while giving out response: {LLMPresentationModelWithValidation.model_json_schema()}.
+Follow this schema while giving out response: {PRESENTATION_SCHEMA_JSON}.
 
 Make description short and obey the character limits. Output should be in JSON format. Give out only JSON, nothing else.
 """
@@ -86,20 +102,25 @@ def get_system_prompt():
     )
 
 
+JSON_OBJECT_RESPONSE_FORMAT = {
+    "type": "json_object",
+}
+
+JSON_SCHEMA_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "LLMPresentationModel",
+        "schema": PRESENTATION_SCHEMA,
+    },
+}
+
+
 def get_response_format():
     is_google_selected = get_selected_llm_provider() == SelectedLLMProvider.GOOGLE
     return (
-        {
-            "type": "json_object",
-        }
+        JSON_OBJECT_RESPONSE_FORMAT
         if is_google_selected
-        else {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "LLMPresentationModel",
-                "schema": LLMPresentationModelWithValidation.model_json_schema(),
-            },
-        }
+        else JSON_SCHEMA_RESPONSE_FORMAT
     )
 
 
@@ -124,6 +145,7 @@ async def generate_presentation_stream(
             },
         ],
         response_format=response_format,
+        temperature=PRESENTATION_TEMPERATURE,
         stream=True,
     )
 
@@ -137,6 +159,12 @@ async def generate_presentation(
     model = get_large_model()
 
     response_format = get_response_format()
+    user_prompt = presentation_outline.to_string()
+
+    cache_key = get_llm_cache_key("presentation", model, user_prompt)
+    cached_response = await get_cached_llm_response(cache_key)
+    if cached_response is not None:
+        return cached_response
 
     response = await client.chat.completions.create(
         model=model,
@@ -147,10 +175,22 @@ async def generate_presentation(
             },
             {
                 "role": "user",
-                "content": presentation_outline.to_string(),
+                "content": user_prompt,
             },
         ],
         response_format=response_format,
+        temperature=PRESENTATION_TEMPERATURE,
     )
 
-    return response.choices[0].message.content
+    # The static system prompt leads every request so providers can cache it
+    usage = response.usage
+    if usage and usage.prompt_tokens_details:
+        logger.debug(
+            "Presentation prompt tokens: %s, cached: %s",
+            usage.prompt_tokens,
+            usage.prompt_tokens_details.cached_tokens,
+        )
+
+    presentation_text = response.choices[0].message.content
+    await set_cached_llm_response(cache_key, presentation_text)
+    return presentation_text
@@ -47,7 +47,9 @@ class LLMHeadingModel(BaseModel):
     description: str
 
     def to_content(self) -> HeadingModel:
-        return HeadingModel(
+        # Fields are already validated here, so they aren't validated again
+        # for every item of every slide
+        return HeadingModel.model_construct(
             heading=self.heading,
             description=self.description,
         )
@@ -56,22 +58,10 @@ class LLMHeadingModel(BaseModel):
 class LLMHeadingModelWithImagePrompt(LLMHeadingModel):
     image_prompt: str
 
-    def to_content(self) -> HeadingModel:
-        return HeadingModel(
-            heading=self.heading,
-            description=self.description,
-        )
-
 
 class LLMHeadingModelWithIconQuery(LLMHeadingModel):
     icon_query: str
 
-    def to_content(self) -> HeadingModel:
-        return HeadingModel(
-            heading=self.heading,
-            description=self.description,
-        )
-
 
 class LLMSlideContentModel(BaseModel):
     title: str
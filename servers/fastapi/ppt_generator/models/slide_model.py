@@ -1,6 +1,6 @@
 import uuid
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError, model_validator
 
 from ppt_generator.models.content_type_models import (
     CONTENT_TYPE_MAPPING,
@@ -37,12 +37,25 @@ class SlideModel(BaseModel):
     )
     properties: Optional[dict] = None
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_content_for_type(cls, data):
+        # Content is validated against the model for its slide type first, so
+        # the content union doesn't try every content model in turn
+        if isinstance(data, dict) and isinstance(data.get("content"), dict):
+            content_type = CONTENT_TYPE_MAPPING.get(data.get("type"))
+            if content_type:
+                try:
+                    data = {**data, "content": content_type(**data["content"])}
+                except ValidationError:
+                    pass
+        return data
+
     @classmethod
     def from_dict(cls, data):
-        slide_model = cls(**data)
-        content = data["content"]
-        slide_model.content = CONTENT_TYPE_MAPPING[slide_model.type](**content)
-        return slide_model
+        # Content is validated once against its own type, not the whole union
+        content = CONTENT_TYPE_MAPPING[data["type"]](**data["content"])
+        return cls(**{**data, "content": content})
 
     def to_create_dict(self, auto_id: bool = False):
         temp = self.model_dump(mode="json")
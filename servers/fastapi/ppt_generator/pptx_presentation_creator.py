@@ -1,4 +1,6 @@
+import logging
 import os
+import re
 from typing import List, Optional
 import uuid
 from lxml import etree
@@ -38,8 +40,13 @@ from ppt_generator.utils import (
     change_image_color,
 )
 
+logger = logging.getLogger(__name__)
+
 BLANK_SLIDE_LAYOUT = 6
 
+# Matches the start of any of the ***, ** and __ markdown markers
+MARKDOWN_MARKER_REGEX = re.compile(r"\*\*|__")
+
 
 class PptxPresentationCreator:
 
@@ -55,6 +62,14 @@ class PptxPresentationCreator:
 
         self._slide_fill = PptxFillModel(color=ppt_model.background_color)
 
+        # Shapes are dispatched by their exact model type
+        self._shape_adders = {
+            PptxPictureBoxModel: self.add_picture,
+            PptxAutoShapeBoxModel: self.add_autoshape,
+            PptxTextBoxModel: self.add_textbox,
+            PptxConnectorModel: self.add_connector,
+        }
+
     def create_ppt(self):
 
         for slide_model in self._slide_models:
@@ -91,19 +106,9 @@ class PptxPresentationCreator:
             self.apply_fill_to_shape(slide.background, self._slide_fill)
 
         for shape_model in slide_model.shapes:
-            model_type = type(shape_model)
-
-            if model_type is PptxPictureBoxModel:
-                self.add_picture(slide, shape_model)
-
-            elif model_type is PptxAutoShapeBoxModel:
-                self.add_autoshape(slide, shape_model)
-
-            elif model_type is PptxTextBoxModel:
-                self.add_textbox(slide, shape_model)
-
-            elif model_type is PptxConnectorModel:
-                self.add_connector(slide, shape_model)
+            add_shape = self._shape_adders.get(type(shape_model))
+            if add_shape:
+                add_shape(slide, shape_model)
 
     def add_connector(self, slide: Slide, connector_model: PptxConnectorModel):
         if connector_model.thickness == 0:
@@ -116,9 +121,11 @@ class PptxPresentationCreator:
 
     def add_picture(self, slide: Slide, picture_model: PptxPictureBoxModel):
         image_path = picture_model.picture.path
+        position = picture_model.position
+        border_radius = picture_model.border_radius
         if (
             picture_model.clip
-            or picture_model.border_radius
+            or border_radius
             or picture_model.overlay
             or picture_model.object_fit
             or picture_model.shape
@@ -126,28 +133,24 @@ class PptxPresentationCreator:
             try:
                 image = Image.open(image_path)
             except:
-                print(f"Could not open image: {image_path}")
+                logger.warning("Could not open image: %s", image_path)
                 return
 
             image = image.convert("RGBA")
             # ? Applying border radius twice to support both clip and object fit
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
+            if border_radius:
+                image = round_image_corners(image, border_radius)
             if picture_model.object_fit:
                 image = fit_image(
                     image,
-                    picture_model.position.width,
-                    picture_model.position.height,
+                    position.width,
+                    position.height,
                     picture_model.object_fit,
                 )
             elif picture_model.clip:
-                image = clip_image(
-                    image,
-                    picture_model.position.width,
-                    picture_model.position.height,
-                )
-            if picture_model.border_radius:
-                image = round_image_corners(image, picture_model.border_radius)
+                image = clip_image(image, position.width, position.height)
+            if border_radius:
+                image = round_image_corners(image, border_radius)
             if picture_model.shape == PptxBoxShapeEnum.CIRCLE:
                 image = create_circle_image(image)
             if picture_model.overlay:
@@ -155,9 +158,7 @@ class PptxPresentationCreator:
             image_path = os.path.join(self._temp_dir, f"{str(uuid.uuid4())}.png")
             image.save(image_path)
 
-        margined_position = self.get_margined_position(
-            picture_model.position, picture_model.margin
-        )
+        margined_position = self.get_margined_position(position, picture_model.margin)
 
         slide.shapes.add_picture(image_path, *margined_position.to_pt_list())
 
@@ -227,71 +228,60 @@ class PptxPresentationCreator:
 
     def parse_markdown_text_to_text_runs(self, font: PptxFontModel, text: str):
         text_runs = []
-        for line in text.split("\n"):
+        lines = text.split("\n")
+        last_line_index = len(lines) - 1
+        for line_index, line in enumerate(lines):
             current_pos = 0
-            while current_pos < len(line):
+            line_length = len(line)
+            while current_pos < line_length:
                 # Check for bold and italic (***text***)
-                if (
-                    line[current_pos:].startswith("***")
-                    and "***" in line[current_pos + 3 :]
+                if line.startswith("***", current_pos) and (
+                    (end_pos := line.find("***", current_pos + 3)) != -1
                 ):
-                    end_pos = line.find("***", current_pos + 3)
                     text_content = line[current_pos + 3 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["bold"] = True
-                    font_json["italic"] = True
                     text_runs.append(
                         PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
+                            text=text_content,
+                            font=font.model_copy(update={"bold": True, "italic": True}),
                         )
                     )
                     current_pos = end_pos + 3
                 # Check for bold (**text**)
-                elif (
-                    line[current_pos:].startswith("**")
-                    and "**" in line[current_pos + 2 :]
+                elif line.startswith("**", current_pos) and (
+                    (end_pos := line.find("**", current_pos + 2)) != -1
                 ):
-                    end_pos = line.find("**", current_pos + 2)
                     text_content = line[current_pos + 2 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["bold"] = True
                     text_runs.append(
                         PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
+                            text=text_content,
+                            font=font.model_copy(update={"bold": True}),
                         )
                     )
                     current_pos = end_pos + 2
                 # Check for italic (*text*)
-                elif (
-                    line[current_pos:].startswith("__")
-                    and "__" in line[current_pos + 2 :]
+                elif line.startswith("__", current_pos) and (
+                    (end_pos := line.find("__", current_pos + 2)) != -1
                 ):
-                    end_pos = line.find("__", current_pos + 2)
                     text_content = line[current_pos + 2 : end_pos]
-                    font_json = font.model_dump()
-                    font_json["italic"] = True
                     text_runs.append(
                         PptxTextRunModel(
-                            text=text_content, font=PptxFontModel(**font_json)
+                            text=text_content,
+                            font=font.model_copy(update={"italic": True}),
                         )
                     )
                     current_pos = end_pos + 2
                 else:
-                    # Find the next formatting marker or end of line
-                    next_marker = float("inf")
-                    for marker in ["***", "**", "__"]:
-                        pos = line.find(marker, current_pos)
-                        if pos != -1:
-                            next_marker = min(next_marker, pos)
-
-                    end_pos = next_marker if next_marker != float("inf") else len(line)
+                    # Find the next formatting marker or end of line, an
+                    # unclosed marker at the current position is kept as text
+                    next_marker = MARKDOWN_MARKER_REGEX.search(line, current_pos + 1)
+                    end_pos = next_marker.start() if next_marker else line_length
                     text_content = line[current_pos:end_pos]
                     if text_content:  # Only add non-empty text
                         text_runs.append(PptxTextRunModel(text=text_content, font=font))
                     current_pos = end_pos
 
             # Add newline if not the last line
-            if line != text.split("\n")[-1]:
+            if line_index != last_line_index:
                 text_runs.append(PptxTextRunModel(text="\n"))
 
         return text_runs
@@ -310,7 +300,7 @@ class PptxPresentationCreator:
             )
             shape.adjustments[0] = normalized_border_radius
         except:
-            print("Could not apply border radius.")
+            logger.warning("Could not apply border radius.")
 
     def apply_fill_to_shape(self, shape: Shape, fill: Optional[PptxFillModel] = None):
         if not fill:
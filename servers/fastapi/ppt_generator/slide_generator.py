@@ -82,6 +82,10 @@ def get_prompt_to_edit_slide_content(
     ]
 
 
+# Slide types offered by the slide type selection prompt
+SELECTABLE_SLIDE_TYPES = (1, 2, 4, 5, 6, 7, 8, 9)
+
+
 def get_prompt_to_select_slide_type(prompt: str, slide_data: dict, slide_type: int):
     return [
         {
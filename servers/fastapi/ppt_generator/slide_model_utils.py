@@ -1,3 +1,5 @@
+import json
+import re
 from typing import List, Optional
 from ppt_generator.models.other_models import (
     TYPE1,
@@ -16,26 +18,34 @@ from ppt_generator.models.query_and_prompt_models import (
     ImageAspectRatio,
     ImagePromptWithThemeAndAspectRatio,
 )
+from ppt_generator.models.llm_models import LLM_CONTENT_TYPE_MAPPING
 from ppt_generator.models.slide_model import SlideModel
 
-SLIDES_WITHOUT_IMAGES = [
-    TYPE2,
-    TYPE5,
-    TYPE6,
-    TYPE7,
-    TYPE8,
-    TYPE9,
-]
+# Characters that open or close json strings, objects and arrays, and escapes
+JSON_STRUCTURE_REGEX = re.compile(r'[{}\[\]"\\]')
 
-SLIDES_WITHOUT_ICONS = [
-    TYPE1,
-    TYPE2,
-    TYPE3,
-    TYPE4,
-    TYPE5,
-    TYPE6,
-    TYPE9,
-]
+SLIDES_WITHOUT_IMAGES = frozenset(
+    {
+        TYPE2,
+        TYPE5,
+        TYPE6,
+        TYPE7,
+        TYPE8,
+        TYPE9,
+    }
+)
+
+SLIDES_WITHOUT_ICONS = frozenset(
+    {
+        TYPE1,
+        TYPE2,
+        TYPE3,
+        TYPE4,
+        TYPE5,
+        TYPE6,
+        TYPE9,
+    }
+)
 
 
 THEME_PROMPTS = {
@@ -63,10 +73,10 @@ class SlideModelUtils:
 
         aspect_ratio = ImageAspectRatio.r_1_1
 
-        if self.type is TYPE3:
+        if self.type == TYPE3:
             aspect_ratio = ImageAspectRatio.r_2_3
 
-        elif self.type is TYPE4:
+        elif self.type == TYPE4:
             count = len(self.content.body)
             aspect_ratio = (
                 ImageAspectRatio.r_5_4 if count == 3 else ImageAspectRatio.r_21_9
@@ -99,3 +109,114 @@ class SlideModelUtils:
             )
             for index, each_query in enumerate(self.content.icon_queries)
         ]
+
+
+def get_slide_model_from_llm_slide(
+    slide: dict, index: int, presentation_id: str
+) -> SlideModel:
+    slide_type = int(slide["type"])
+    # Content is validated against its LLM model and the remaining fields
+    # are set here, so the slide model is built without revalidating. The
+    # type is checked first since model_construct doesn't validate it.
+    content_model = LLM_CONTENT_TYPE_MAPPING.get(slide_type)
+    if content_model is None:
+        raise ValueError(f"Invalid slide type: {slide_type}")
+    return SlideModel.model_construct(
+        index=index,
+        type=slide_type,
+        presentation=presentation_id,
+        content=content_model.model_validate(slide["content"]).to_content(),
+    )
+
+
+def get_slide_models_from_presentation_json(
+    presentation_json: dict, presentation_id: str
+) -> List[SlideModel]:
+    return [
+        get_slide_model_from_llm_slide(slide, i, presentation_id)
+        for i, slide in enumerate(presentation_json["slides"])
+    ]
+
+
+class StreamedSlidesParser:
+    """Finds the slides of a streamed presentation json as soon as each is complete"""
+
+    # Depth of slide objects in {"slides": [{...}, ...]}
+    SLIDE_DEPTH = 3
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        # Last string seen directly inside the top level object, used to find
+        # the array that holds the slides
+        self.last_key = None
+        self.in_slides_array = False
+        # Pieces of the key string and slide object still being streamed
+        self.key_chunks: Optional[List[str]] = None
+        self.slide_chunks: Optional[List[str]] = None
+
+    def get_text(self) -> str:
+        return "".join(self.chunks)
+
+    def feed(self, chunk: str) -> List[dict]:
+        self.chunks.append(chunk)
+        slides = []
+        key_start = slide_start = 0
+        # Index of a character escaped by a backslash, which is skipped
+        skip = 0 if self.escaped else -1
+
+        # Only characters that change the scanner state are visited
+        for match in JSON_STRUCTURE_REGEX.finditer(chunk):
+            i = match.start()
+            if i == skip:
+                continue
+            char = match.group()
+            if self.in_string:
+                if char == "\\":
+                    skip = i + 1
+                elif char == '"':
+                    self.in_string = False
+                    if self.key_chunks is not None:
+                        self.key_chunks.append(chunk[key_start:i])
+                        self.last_key = "".join(self.key_chunks)
+                        self.key_chunks = None
+            elif char == '"':
+                self.in_string = True
+                if self.depth == 1:
+                    self.key_chunks = []
+                    key_start = i + 1
+            elif char == "{" or char == "[":
+                self.depth += 1
+                if char == "[" and self.depth == 2:
+                    self.in_slides_array = self.last_key == "slides"
+                elif (
+                    char == "{"
+                    and self.depth == self.SLIDE_DEPTH
+                    and self.in_slides_array
+                ):
+                    self.slide_chunks = []
+                    slide_start = i
+            else:
+                if (
+                    char == "}"
+                    and self.depth == self.SLIDE_DEPTH
+                    and self.slide_chunks is not None
+                ):
+                    self.slide_chunks.append(chunk[slide_start : i + 1])
+                    try:
+                        slides.append(json.loads("".join(self.slide_chunks)))
+                    except ValueError:
+                        pass
+                    self.slide_chunks = None
+                elif char == "]" and self.depth == 2:
+                    self.in_slides_array = False
+                self.depth -= 1
+
+        if self.key_chunks is not None:
+            self.key_chunks.append(chunk[key_start:])
+        if self.slide_chunks is not None:
+            self.slide_chunks.append(chunk[slide_start:])
+        self.escaped = skip == len(chunk)
+        return slides
@@ -0,0 +1,67 @@
+import json
+
+from ppt_generator.slide_model_utils import StreamedSlidesParser
+
+
+def feed_in_chunks(text: str, chunk_size: int):
+    parser = StreamedSlidesParser()
+    slides = []
+    for index in range(0, len(text), chunk_size):
+        slides.extend(parser.feed(text[index : index + chunk_size]))
+    return parser, slides
+
+
+def test_slides_are_found_for_every_chunk_size():
+    presentation = {
+        "slides": [
+            {"type": 1, "content": {"title": "Intro", "body": "Hello"}},
+            {"type": 2, "content": {"title": "List", "body": [{"heading": "a"}]}},
+        ]
+    }
+    text = json.dumps(presentation, indent=2)
+
+    for chunk_size in range(1, len(text) + 1):
+        parser, slides = feed_in_chunks(text, chunk_size)
+        assert slides == presentation["slides"]
+        assert parser.get_text() == text
+
+
+def test_escaped_quotes_and_backslashes_in_strings():
+    presentation = {
+        "slides": [
+            {"type": 1, "content": {"title": 'He said "}"', "body": "C:\\path\\"}},
+            {"type": 1, "content": {"title": '\\"', "body": "\\\\"}},
+        ]
+    }
+    text = json.dumps(presentation)
+
+    for chunk_size in range(1, 8):
+        _, slides = feed_in_chunks(text, chunk_size)
+        assert slides == presentation["slides"]
+
+
+def test_braces_and_brackets_inside_strings():
+    presentation = {
+        "slides": [
+            {"type": 1, "content": {"title": "{[", "body": "]} {\"slides\": [{}]}"}},
+        ]
+    }
+    text = json.dumps(presentation)
+
+    for chunk_size in range(1, 8):
+        _, slides = feed_in_chunks(text, chunk_size)
+        assert slides == presentation["slides"]
+
+
+def test_depth_three_objects_outside_slides_are_ignored():
+    presentation = {
+        "notes": [{"text": "not a slide"}],
+        "meta": {"theme": {"name": "dark"}},
+        "slides": [{"type": 1, "content": {"graph": {"data": [{"x": 1}]}}}],
+        "extra": [{"type": 2}],
+    }
+    text = json.dumps(presentation)
+
+    for chunk_size in range(1, 8):
+        _, slides = feed_in_chunks(text, chunk_size)
+        assert slides == presentation["slides"]